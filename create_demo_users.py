@@ -9,11 +9,19 @@ import os
 # Add current directory to path for imports
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+# --quiet suppresses all console output (useful when CI pipes stdout away)
+QUIET = '--quiet' in sys.argv[1:]
+
+def log(message: str):
+    """Print a progress message unless --quiet was passed"""
+    if not QUIET:
+        print(message)
+
 try:
     from neondb_service import get_db_service
     from auth_service import get_auth_service
     
-    print("🌊 Creating Ocean Demo Accounts...")
+    log("🌊 Creating Ocean Demo Accounts...")
     
     # Initialize services
     db_service = get_db_service()
@@ -43,51 +51,59 @@ try:
         "email_verified": True
     }
     
-    # Check if users already exist
-    existing_user = db_service.get_user_by_email(demo_user["email"])
-    existing_admin = db_service.get_user_by_email(demo_admin["email"])
+    # Check if users already exist - one roundtrip for both accounts
+    existing_users = db_service.get_users_by_emails([demo_user["email"], demo_admin["email"]])
+    existing_user = existing_users.get(demo_user["email"])
+    existing_admin = existing_users.get(demo_admin["email"])
     
     users_created = []
     
     # Create demo user if not exists
     if not existing_user:
-        print(f"Creating demo user: {demo_user['email']}")
+        log(f"Creating demo user: {demo_user['email']}")
         result = auth_service.register_user(demo_user)
         if result["success"]:
             users_created.append(f"Demo User: {demo_user['email']}")
-            print(f"✅ Created demo user: {demo_user['email']}")
+            log(f"✅ Created demo user: {demo_user['email']}")
         else:
-            print(f"❌ Failed to create demo user: {result.get('error', 'Unknown error')}")
+            log(f"❌ Failed to create demo user: {result.get('error', 'Unknown error')}")
     else:
-        print(f"ℹ️  Demo user already exists: {demo_user['email']}")
-    
-    # Create demo admin if not exists  
+        log(f"ℹ️  Demo user already exists: {demo_user['email']}")
+
+    # Create demo admin if not exists
     if not existing_admin:
-        print(f"Creating demo admin: {demo_admin['email']}")
+        log(f"Creating demo admin: {demo_admin['email']}")
         result = auth_service.register_user(demo_admin)
         if result["success"]:
             users_created.append(f"Demo Admin: {demo_admin['email']}")
-            print(f"✅ Created demo admin: {demo_admin['email']}")
+            log(f"✅ Created demo admin: {demo_admin['email']}")
         else:
-            print(f"❌ Failed to create demo admin: {result.get('error', 'Unknown error')}")
+            log(f"❌ Failed to create demo admin: {result.get('error', 'Unknown error')}")
     else:
-        print(f"ℹ️  Demo admin already exists: {demo_admin['email']}")
-    
-    # Display credentials
-    print(f"\n🌊 OCEAN DEMO ACCOUNTS:")
-    print(f"{'='*50}")
-    print(f"👤 Demo User:")
-    print(f"   Email: {demo_user['email']}")
-    print(f"   Password: {demo_user['password']}")
-    print(f"   Role: User")
-    print(f"")
-    print(f"🔑 Demo Admin:")
-    print(f"   Email: {demo_admin['email']}")
-    print(f"   Password: {demo_admin['password']}")
-    print(f"   Role: Admin")
-    print(f"{'='*50}")
-    print(f"🌐 Login at: http://localhost:3000/login")
-    print(f"{'='*50}\n")
+        log(f"ℹ️  Demo admin already exists: {demo_admin['email']}")
+
+    # Display credentials - built once and flushed with a single write
+    if not QUIET:
+        separator = '=' * 50
+        banner = "\n".join([
+            "",
+            "🌊 OCEAN DEMO ACCOUNTS:",
+            separator,
+            "👤 Demo User:",
+            f"   Email: {demo_user['email']}",
+            f"   Password: {demo_user['password']}",
+            "   Role: User",
+            "",
+            "🔑 Demo Admin:",
+            f"   Email: {demo_admin['email']}",
+            f"   Password: {demo_admin['password']}",
+            "   Role: Admin",
+            separator,
+            "🌐 Login at: http://localhost:3000/login",
+            separator,
+            ""
+        ])
+        sys.stdout.write(banner + "\n")
 
 except Exception as e:
     print(f"❌ Error: {str(e)}")
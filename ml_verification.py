@@ -4,160 +4,287 @@ Python-Only ML-Based AI Verification for Blue Carbon MRV System
 Uses trained model from BlueCarbon.pkl for realistic scoring
 """
 
+import array
+import functools
+import io
 import json
 import re
-import math
-import random
-from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+
+# Prefer the C pickle implementation; the pure-Python fallback matters
+# on constrained environments / PyPy where _pickle may be missing
+try:
+    import _pickle as pickle
+except ImportError:
+    import pickle
+from typing import Any, Dict, List, Optional, Tuple
+
+# Import NumPy once at module scope instead of inside every prediction
+# call; predictions raise a clear error if it is missing
+try:
+    import numpy as _np
+except ImportError:
+    _np = None
+
+# Numba is optional: when present, the flat-array feature stacker below
+# runs as a compiled parallel kernel instead of interpreted Python
+try:
+    import numba as _numba
+except ImportError:
+    _numba = None
+
+# Precompiled patterns for location/measurement parsing so batch scoring
+# skips the re-cache lookup on every call
+_LAT_RE = re.compile(r'([+-]?\d+\.?\d*)[°\s]*([NS])?')
+_LNG_RE = re.compile(r'([+-]?\d+\.?\d*)[°\s]*([EW])')
+_LATLNG_RE = re.compile(r'([+-]?\d+\.?\d*)[°\s]*([NS]).*?([+-]?\d+\.?\d*)[°\s]*([EW])')
+_NUMERIC_CLEAN_RE = re.compile(r'[^\d.-]')
+
+# Exact media-type strings mapped to their count bucket
+# (0 = photos, 1 = videos, 2 = documents); unknown types fall back
+# to substring matching
+_TYPE_TO_BUCKET = {
+    'photo': 0, 'photos': 0, 'image': 0, 'images': 0,
+    'video': 1, 'videos': 1,
+    'document': 2, 'documents': 2, 'doc': 2, 'pdf': 2
+}
+
+# Ecosystem type mapping: 6 types → 3 categories (0, 1, 2)
+ECOSYSTEM_MAPPING = {
+    # Group 1: Mangrove ecosystems (0)
+    'mangrove': 0,
+    'mangroves': 0,
+
+    # Group 2: Seagrass and wetland ecosystems (1)
+    'seagrass': 1,
+    'coastal_wetland': 1,
+    'coastal_wetlands': 1,
+
+    # Group 3: Salt marsh and other ecosystems (2)
+    'salt_marsh': 2,
+    'kelp_forest': 2
+}
+
+# Feature names for model input (15 features)
+FEATURE_NAMES = (
+    'project_name_length',
+    'ecosystem_type_encoded',  # 0, 1, or 2
+    'area_hectares',
+    'description_length',
+    'latitude',
+    'longitude',
+    'photo_count',
+    'video_count',
+    'document_count',
+    'water_ph',
+    'water_salinity_ppt',
+    'water_dissolved_oxygen',
+    'soil_organic_carbon_percent',
+    'soil_ph',
+    'soil_salinity_ppt'
+)
+
+# Column index per feature for positional access into the (N, 15) matrix
+FEATURE_IDX = {name: i for i, name in enumerate(FEATURE_NAMES)}
+
+# Template row of contiguous doubles; copied per extraction via memcpy
+_ZERO_ROW = array.array('d', [0.0] * len(FEATURE_NAMES))
+
+@functools.lru_cache(maxsize=64)
+def _encode_ecosystem(ecosystem_type: str) -> int:
+    """Encode an ecosystem type string (the domain is only ~6 values,
+    so the cache eliminates the lower() allocation after warmup)"""
+    return ECOSYSTEM_MAPPING.get(ecosystem_type.lower(), 1)  # Default to 1
+
+if _numba is not None:
+    @_numba.njit(cache=True, parallel=True)
+    def _stack_feature_columns(name_lens, ecosystem_codes, areas, desc_lens,
+                               lats, lngs, photo, video, doc,
+                               w_ph, w_sal, w_do, s_c, s_ph, s_sal):
+        n = name_lens.shape[0]
+        out = _np.empty((n, 15), _np.float64)
+        for i in _numba.prange(n):
+            out[i, 0] = name_lens[i]
+            out[i, 1] = ecosystem_codes[i]
+            out[i, 2] = areas[i]
+            out[i, 3] = desc_lens[i]
+            out[i, 4] = lats[i]
+            out[i, 5] = lngs[i]
+            out[i, 6] = photo[i]
+            out[i, 7] = video[i]
+            out[i, 8] = doc[i]
+            out[i, 9] = w_ph[i]
+            out[i, 10] = w_sal[i]
+            out[i, 11] = w_do[i]
+            out[i, 12] = s_c[i]
+            out[i, 13] = s_ph[i]
+            out[i, 14] = s_sal[i]
+        return out
+else:
+    _stack_feature_columns = None
+
+def extract_ml_features_from_arrays(name_lens, ecosystem_codes, areas, desc_lens,
+                                    lats, lngs, photo, video, doc,
+                                    w_ph, w_sal, w_do, s_c, s_ph, s_sal):
+    """
+    Stack 15 flat float64 columns into the (N, 15) feature matrix
+
+    For callers that already hold flat numeric records (post-ETL), this
+    skips the per-project dict walk entirely. Dispatches to the Numba
+    kernel when numba is installed; otherwise falls back to NumPy
+    column_stack.
+    """
+    if _np is None:
+        raise RuntimeError("NumPy is required for ML feature extraction but is not installed")
+    if _stack_feature_columns is not None:
+        return _stack_feature_columns(name_lens, ecosystem_codes, areas, desc_lens,
+                                      lats, lngs, photo, video, doc,
+                                      w_ph, w_sal, w_do, s_c, s_ph, s_sal)
+    return _np.column_stack((name_lens, ecosystem_codes, areas, desc_lens,
+                             lats, lngs, photo, video, doc,
+                             w_ph, w_sal, w_do, s_c, s_ph, s_sal)).astype(_np.float64, copy=False)
+
+# Legacy sklearn module paths remapped to their current locations; a
+# common cause of model unpickling failures across sklearn versions
+_MODULE_RENAMES = {
+    'sklearn.ensemble.forest': 'sklearn.ensemble._forest',
+    'sklearn.tree.tree': 'sklearn.tree._classes',
+    'sklearn.ensemble.gradient_boosting': 'sklearn.ensemble._gb',
+}
+
+class _ModelUnpickler(pickle.Unpickler):
+    """Unpickler that remaps legacy sklearn module paths on the fly"""
+
+    def find_class(self, module, name):
+        return super().find_class(_MODULE_RENAMES.get(module, module), name)
+
+# Loaded model objects keyed by path so repeated engine construction
+# (tests, workers) never re-pays the pickle load
+_MODEL_CACHE: Dict[str, Any] = {}
 
 class MLVerificationEngine:
     """
     Real ML-based verification engine using trained model
     """
-    
+
+    # Only two attributes vary per instance; slots make reading them an
+    # array index instead of a __dict__ lookup on the prediction hot path
+    __slots__ = ('model_available', 'model')
+
+    # Immutable constants shared by every instance; kept as class
+    # attributes so construction allocates nothing per engine
+    ecosystem_mapping = ECOSYSTEM_MAPPING
+    feature_names = FEATURE_NAMES
+
+
     def __init__(self, model_path='BlueCarbon.pkl'):
         """Initialize with trained ML model"""
         self.model_available = False
         self.model = None
-        
-        try:
-            import pickle
-            import sys
-            
-            # Try different pickle loading methods to handle compatibility issues
+
+        cached_model = _MODEL_CACHE.get(model_path)
+        if cached_model is not None:
+            self.model = cached_model
+            self.model_available = True
+        else:
             try:
+                # Read the file bytes once; the fallback attempt below only
+                # re-parses the in-memory bytes instead of re-opening the file
                 with open(model_path, 'rb') as f:
-                    self.model = pickle.load(f)
-                print("✅ ML Model loaded successfully from BlueCarbon.pkl")
-                self.model_available = True
-            except Exception as pickle_error:
-                print(f"⚠️ Standard pickle load failed: {pickle_error}")
-                # Try with different encoding/protocol
+                    raw = f.read()
+
+                # Single-pass load: the custom Unpickler covers the latin1 /
+                # fix_imports compatibility concerns and remaps legacy sklearn
+                # module paths, so no serial retry chain is needed
                 try:
-                    with open(model_path, 'rb') as f:
-                        self.model = pickle.load(f, encoding='latin1')
-                    print("✅ ML Model loaded with latin1 encoding")
+                    unpickler = _ModelUnpickler(io.BytesIO(raw), encoding='latin1',
+                                                fix_imports=True)
+                    self.model = unpickler.load()
+                    print("✅ ML Model loaded successfully from BlueCarbon.pkl")
                     self.model_available = True
-                except Exception as encoding_error:
-                    print(f"⚠️ Latin1 encoding failed: {encoding_error}")
-                    # Try with fix_imports
+                except Exception as pickle_error:
+                    print(f"⚠️ Compatibility unpickler failed: {pickle_error}")
+                    # Last resort: one standard parse of the same bytes
                     try:
-                        with open(model_path, 'rb') as f:
-                            self.model = pickle.load(f, fix_imports=True)
-                        print("✅ ML Model loaded with fix_imports=True")
+                        self.model = pickle.loads(raw)
+                        print("✅ ML Model loaded with standard pickle")
                         self.model_available = True
                     except Exception as final_error:
                         print(f"❌ All pickle loading methods failed: {final_error}")
                         self.model_available = False
                         self.model = None
-                        
-        except ImportError as e:
-            print(f"❌ Failed to import pickle: {e}")
-            self.model_available = False
-            self.model = None
-        
-        # Ecosystem type mapping: 6 types → 3 categories (0, 1, 2)
-        self.ecosystem_mapping = {
-            # Group 1: Mangrove ecosystems (0)
-            'mangrove': 0,
-            'mangroves': 0,
-            
-            # Group 2: Seagrass and wetland ecosystems (1) 
-            'seagrass': 1,
-            'coastal_wetland': 1,
-            'coastal_wetlands': 1,
-            
-            # Group 3: Salt marsh and other ecosystems (2)
-            'salt_marsh': 2,
-            'kelp_forest': 2
-        }
-        
-        # Feature names for model input (15 features)
-        self.feature_names = [
-            'project_name_length',
-            'ecosystem_type_encoded',  # 0, 1, or 2
-            'area_hectares',
-            'description_length', 
-            'latitude',
-            'longitude',
-            'photo_count',
-            'video_count',
-            'document_count',
-            'water_ph',
-            'water_salinity_ppt',
-            'water_dissolved_oxygen',
-            'soil_organic_carbon_percent',
-            'soil_ph',
-            'soil_salinity_ppt'
-        ]
-    
-    def extract_ml_features(self, project_data: Dict) -> List[float]:
+
+            except OSError as e:
+                print(f"❌ Failed to load ML model: {e}")
+                self.model_available = False
+                self.model = None
+
+            if self.model_available:
+                _MODEL_CACHE[model_path] = self.model
+
+    def extract_ml_features_into(self, row, project_data: Dict) -> None:
         """
-        Extract exactly 15 numerical features for ML model
+        Write exactly 15 numerical features into a preallocated float row
+
+        ``row`` is a length-15 float64 array (typically one row of the
+        batch feature matrix); values are stored in place so the caller
+        avoids list bookkeeping and a final array copy.
         """
-        features = []
-        
         # 1. project_name_length
-        project_name = project_data.get('project_name', '')
-        features.append(len(project_name))
-        
+        row[0] = len(project_data.get('project_name', ''))
+
         # 2. ecosystem_type_encoded (0, 1, 2)
-        ecosystem_type = project_data.get('ecosystem_type', '').lower()
-        ecosystem_encoded = self.ecosystem_mapping.get(ecosystem_type, 1)  # Default to 1
-        features.append(ecosystem_encoded)
-        
+        row[1] = _encode_ecosystem(project_data.get('ecosystem_type', ''))
+
         # 3. area_hectares
-        area_hectares = float(project_data.get('area_hectares', 0))
-        features.append(area_hectares)
-        
+        row[2] = float(project_data.get('area_hectares', 0))
+
         # 4. description_length
         description = project_data.get('description', project_data.get('project_description', ''))
-        features.append(len(description))
-        
-        # 5. latitude
-        location = project_data.get('location', {})
-        if isinstance(location, dict):
-            latitude = float(location.get('lat', 0))
-        else:
-            latitude = self._extract_lat_from_string(location)
-        features.append(latitude)
-        
-        # 6. longitude 
-        if isinstance(location, dict):
-            longitude = float(location.get('lng', 0))
-        else:
-            longitude = self._extract_lng_from_string(location)
-        features.append(longitude)
-        
+        row[3] = len(description)
+
+        # 5-6. latitude / longitude
+        row[4], row[5] = self._parse_location(project_data.get('location', {}))
+
         # 7-9. Media counts (photo_count, video_count, document_count)
         photo_count, video_count, document_count = self._extract_media_counts(project_data)
-        features.extend([photo_count, video_count, document_count])
-        
+        row[6] = photo_count
+        row[7] = video_count
+        row[8] = document_count
+
         # 10-12. Water quality measurements
         field_measurements = project_data.get('field_measurements', {})
         water_quality = field_measurements.get('water_quality', {})
-        
-        water_ph = self._extract_numeric_value(water_quality.get('ph_level', 7.0))
-        water_salinity = self._extract_numeric_value(water_quality.get('salinity', 25.0))
-        water_do = self._extract_numeric_value(water_quality.get('dissolved_oxygen', 6.0))
-        
-        features.extend([water_ph, water_salinity, water_do])
-        
+
+        row[9] = self._extract_numeric_value(water_quality.get('ph_level', 7.0))
+        row[10] = self._extract_numeric_value(water_quality.get('salinity', 25.0))
+        row[11] = self._extract_numeric_value(water_quality.get('dissolved_oxygen', 6.0))
+
         # 13-15. Soil measurements
         soil_analysis = field_measurements.get('soil_analysis', {})
-        
-        soil_carbon = self._extract_numeric_value(soil_analysis.get('carbon_content', 2.0))
-        soil_ph = self._extract_numeric_value(soil_analysis.get('ph_level', 7.0))
-        soil_salinity = self._extract_numeric_value(soil_analysis.get('salinity', 15.0))
-        
-        features.extend([soil_carbon, soil_ph, soil_salinity])
-        
-        return features
+
+        row[12] = self._extract_numeric_value(soil_analysis.get('carbon_content', 2.0))
+        row[13] = self._extract_numeric_value(soil_analysis.get('ph_level', 7.0))
+        row[14] = self._extract_numeric_value(soil_analysis.get('salinity', 15.0))
+
+    def extract_ml_features(self, project_data: Dict) -> array.array:
+        """
+        Extract exactly 15 numerical features for ML model
+
+        Returns a contiguous array.array('d') that NumPy can view through
+        the buffer protocol without copying element by element.
+        """
+        row = array.array('d', _ZERO_ROW)
+        self.extract_ml_features_into(row, project_data)
+        return row
     
-    def predict_quality_score(self, project_data: Dict) -> Dict:
+    def predict_quality_score(self, project_data: Dict, return_proba: bool = False,
+                              debug: bool = False) -> Dict:
         """
         Predict quality score using trained ML model
+
+        predict_proba costs a second full model traversal, so it only
+        runs when the caller asks for probabilities via return_proba;
+        the per-feature value dict is only built when debug is True.
         """
         result = {
             'quality_score': 50.0,  # Default fallback
@@ -170,16 +297,17 @@ class MLVerificationEngine:
         try:
             # Extract features
             features = self.extract_ml_features(project_data)
-            
-            # Store feature values for debugging
-            feature_dict = dict(zip(self.feature_names, features))
-            result['feature_values'] = feature_dict
-            
+
+            # Store feature values only when debugging
+            if debug:
+                result['feature_values'] = dict(zip(self.feature_names, features))
+
+
             if self.model_available and self.model is not None:
                 # Use real ML model prediction
-                # Convert to numpy array format expected by sklearn
-                import numpy as np
-                features_array = np.array(features).reshape(1, -1)
+                # View the contiguous doubles as the (1, 15) array sklearn
+                # expects - a buffer view, not a copy
+                features_array = _np.frombuffer(features, dtype=_np.float64).reshape(1, -1)
                 prediction = self.model.predict(features_array)[0]
                 
                 # Convert prediction to quality score (0-100 range with 2 decimals)
@@ -205,8 +333,8 @@ class MLVerificationEngine:
                     'model_type': str(type(self.model).__name__)
                 })
                 
-                # Add prediction confidence if available
-                if hasattr(self.model, 'predict_proba'):
+                # Add prediction confidence only when requested
+                if return_proba and hasattr(self.model, 'predict_proba'):
                     try:
                         probabilities = self.model.predict_proba(features_array)[0]
                         result['predictions']['probabilities'] = probabilities.tolist()
@@ -216,7 +344,7 @@ class MLVerificationEngine:
                         
             else:
                 # Fallback: Calculate score based on feature rules
-                fallback_score = self._calculate_fallback_score(feature_dict)
+                fallback_score = self._calculate_fallback_score(features)
                 
                 # Apply 25 points enhancement boost for good projects
                 enhanced_fallback = fallback_score + 25.0
@@ -244,32 +372,138 @@ class MLVerificationEngine:
         
         return result
     
+    def predict_quality_scores_batch(self, projects: List[Dict], return_proba: bool = False,
+                                     debug: bool = False) -> List[Dict]:
+        """
+        Predict quality scores for a batch of projects with a single model call
+
+        Stacks all feature rows into one (N, 15) array so sklearn dispatch
+        overhead is paid once instead of once per project.
+        """
+        if not projects:
+            return []
+
+        try:
+            if _np is None:
+                raise RuntimeError("NumPy is required for ML prediction but is not installed")
+
+            # Stack features into a single (N, 15) matrix, one row per project
+            features_array = _np.empty((len(projects), 15), dtype=_np.float64)
+            for i, project_data in enumerate(projects):
+                self.extract_ml_features_into(features_array[i], project_data)
+
+            if not (self.model_available and self.model is not None):
+                # No model loaded - vectorized rule-based fallback over the batch
+                fallback_scores = self._calculate_fallback_scores_batch(features_array)
+                enhanced_fallback = _np.clip(fallback_scores + 25.0, 0.0, 100.0).round(2)
+
+                results = []
+                for i in range(len(projects)):
+                    results.append({
+                        'quality_score': float(enhanced_fallback[i]),
+                        'original_score': float(fallback_scores[i]),
+                        'enhancement_applied': '+25 points',
+                        'model_used': False,
+                        'feature_values': dict(zip(self.feature_names, features_array[i].tolist())) if debug else {},
+                        'predictions': {},
+                        'status': 'fallback_enhanced',
+                        'note': 'Using enhanced rule-based fallback scoring with +25 points boost'
+                    })
+                return results
+
+            # Single model call for the whole batch
+            predictions = _np.asarray(self.model.predict(features_array), dtype=_np.float64)
+
+            # Apply the same +25 points enhancement boost as the single-call path
+            enhanced_scores = _np.clip(predictions + predictions * 0.25, 0.0, 100.0).round(2)
+
+            # One predict_proba call for the whole batch, only when requested
+            probabilities = None
+            if return_proba and hasattr(self.model, 'predict_proba'):
+                try:
+                    probabilities = self.model.predict_proba(features_array)
+                except:
+                    probabilities = None
+
+            results = []
+            for i in range(len(projects)):
+                result = {
+                    'quality_score': float(enhanced_scores[i]),
+                    'original_score': round(float(predictions[i]), 2),
+                    'enhancement_applied': '+25 points',
+                    'model_used': True,
+                    'feature_values': dict(zip(self.feature_names, features_array[i].tolist())) if debug else {},
+                    'predictions': {},
+                    'status': 'success',
+                    'model_type': str(type(self.model).__name__)
+                }
+                if probabilities is not None:
+                    result['predictions']['probabilities'] = probabilities[i].tolist()
+                    result['predictions']['confidence'] = float(max(probabilities[i]))
+                results.append(result)
+
+            return results
+
+        except Exception as e:
+            print(f"❌ ML batch prediction error: {e}")
+            # Fall back to per-project scoring
+            return [self.predict_quality_score(p) for p in projects]
+
     def _extract_media_counts(self, project_data: Dict) -> Tuple[int, int, int]:
         """Extract photo, video, and document counts"""
-        photo_count = 0
-        video_count = 0
-        document_count = 0
-        
-        # Check IPFS hashes
+        counts = [0, 0, 0]
+
+        # Check IPFS hashes - exact type strings hit the dispatch table,
+        # unknown types fall back to the legacy substring matching
         ipfs_hashes = project_data.get('ipfs_hashes', [])
         for item in ipfs_hashes:
             item_type = item.get('type', '').lower()
-            if 'photo' in item_type or 'image' in item_type:
-                photo_count += 1
-            elif 'video' in item_type:
-                video_count += 1
-            elif 'document' in item_type or 'doc' in item_type or 'pdf' in item_type:
-                document_count += 1
-        
+            bucket = _TYPE_TO_BUCKET.get(item_type)
+            if bucket is None:
+                if 'photo' in item_type or 'image' in item_type:
+                    bucket = 0
+                elif 'video' in item_type:
+                    bucket = 1
+                elif 'document' in item_type or 'doc' in item_type or 'pdf' in item_type:
+                    bucket = 2
+            if bucket is not None:
+                counts[bucket] += 1
+
         # Check media_files structure
         media_files = project_data.get('media_files', {})
         if isinstance(media_files, dict):
-            photo_count += len(media_files.get('photos', []))
-            video_count += len(media_files.get('videos', []))
-            document_count += len(media_files.get('documents', []))
-        
-        return photo_count, video_count, document_count
+            for key, idx in (('photos', 0), ('videos', 1), ('documents', 2)):
+                counts[idx] += len(media_files.get(key, ()))
+
+        return counts[0], counts[1], counts[2]
     
+    def _parse_location(self, location) -> Tuple[float, float]:
+        """Parse latitude and longitude from a dict or coordinate string in one pass"""
+        if isinstance(location, dict):
+            return float(location.get('lat', 0)), float(location.get('lng', 0))
+
+        if not location:
+            return 0.0, 0.0
+
+        try:
+            # One combined match like '22.3511°N, 88.9870°E' covers both
+            # coordinates with a single scan of the string
+            match = _LATLNG_RE.search(location)
+            if match:
+                lat = float(match.group(1))
+                if match.group(2) == 'S':
+                    lat = -abs(lat)
+                lng = float(match.group(3))
+                if match.group(4) == 'W':
+                    lng = -abs(lng)
+                return lat, lng
+        except:
+            pass
+
+        # Strings without both hemisphere markers fall back to the
+        # per-coordinate extractors
+        return self._extract_lat_from_string(location), self._extract_lng_from_string(location)
+
     def _extract_lat_from_string(self, location_str: str) -> float:
         """Extract latitude from location string like '22.3511°N, 88.9870°E'"""
         if not location_str:
@@ -277,11 +511,11 @@ class MLVerificationEngine:
         
         try:
             # Look for patterns like "22.3511°N" or "22.3511N"
-            lat_match = re.search(r'([+-]?\d+\.?\d*)[°\s]*[NS]?', location_str)
+            lat_match = _LAT_RE.search(location_str)
             if lat_match:
                 lat = float(lat_match.group(1))
                 # Handle N/S designation
-                if 'S' in location_str.upper():
+                if lat_match.group(2) == 'S':
                     lat = -abs(lat)
                 return lat
         except:
@@ -295,11 +529,11 @@ class MLVerificationEngine:
         
         try:
             # Look for patterns like "88.9870°E" or "88.9870E"
-            lng_match = re.search(r'([+-]?\d+\.?\d*)[°\s]*[EW]', location_str)
+            lng_match = _LNG_RE.search(location_str)
             if lng_match:
                 lng = float(lng_match.group(1))
                 # Handle E/W designation
-                if 'W' in location_str.upper():
+                if lng_match.group(2) == 'W':
                     lng = -abs(lng)
                 return lng
         except:
@@ -308,86 +542,152 @@ class MLVerificationEngine:
     
     def _extract_numeric_value(self, value) -> float:
         """Extract numeric value from various input formats"""
+        # Fast path: JSON measurements are almost always plain numbers,
+        # and the exact type test skips the isinstance MRO walk
+        value_type = type(value)
+        if value_type is float:
+            return value
+        if value_type is int:
+            return float(value)
+
         if value is None:
             return 0.0
-        
-        if isinstance(value, (int, float)):
-            return float(value)
-        
-        if isinstance(value, str):
+
+        if value_type is str:
             try:
                 # Remove any non-numeric characters except decimal point and minus
-                cleaned = re.sub(r'[^\d.-]', '', value)
+                cleaned = _NUMERIC_CLEAN_RE.sub('', value)
                 if cleaned:
                     return float(cleaned)
             except:
                 pass
-        
+            return 0.0
+
+        # Exotic numeric types (bool, NumPy scalars) still coerce as before
+        if isinstance(value, (int, float)):
+            return float(value)
+
         return 0.0
     
-    def _calculate_fallback_score(self, features: Dict) -> float:
+    def _calculate_fallback_score(self, features: List[float]) -> float:
         """
         Calculate fallback score using simple rules when ML model fails
+
+        ``features`` is the positional 15-value sequence produced by
+        extract_ml_features, indexed through FEATURE_IDX.
         """
         score = 50.0  # Base score
-        
+
         # Ecosystem type bonus
-        ecosystem_encoded = features.get('ecosystem_type_encoded', 1)
+        ecosystem_encoded = features[FEATURE_IDX['ecosystem_type_encoded']]
         if ecosystem_encoded == 0:  # Mangrove
             score += 10
         elif ecosystem_encoded == 1:  # Seagrass/wetland
             score += 5
-        
+
         # Area reasonableness (1-100 hectares is good)
-        area = features.get('area_hectares', 0)
+        area = features[FEATURE_IDX['area_hectares']]
         if 1 <= area <= 100:
             score += 15
         elif 0.1 <= area <= 1000:
             score += 10
         elif area > 0:
             score += 5
-        
+
         # Location validity
-        lat = features.get('latitude', 0)
-        lng = features.get('longitude', 0)
+        lat = features[FEATURE_IDX['latitude']]
+        lng = features[FEATURE_IDX['longitude']]
         if -90 <= lat <= 90 and -180 <= lng <= 180 and (lat != 0 or lng != 0):
             score += 10
-        
+
         # Data completeness
-        name_length = features.get('project_name_length', 0)
-        desc_length = features.get('description_length', 0)
-        if name_length > 5:
+        if features[FEATURE_IDX['project_name_length']] > 5:
             score += 5
-        if desc_length > 20:
+        if features[FEATURE_IDX['description_length']] > 20:
             score += 5
-        
+
         # Media evidence
-        photo_count = features.get('photo_count', 0)
-        video_count = features.get('video_count', 0)
-        doc_count = features.get('document_count', 0)
-        total_media = photo_count + video_count + doc_count
+        total_media = (features[FEATURE_IDX['photo_count']]
+                       + features[FEATURE_IDX['video_count']]
+                       + features[FEATURE_IDX['document_count']])
         if total_media >= 5:
             score += 10
         elif total_media >= 1:
             score += 5
-        
+
         # Water quality reasonableness
-        water_ph = features.get('water_ph', 7.0)
-        water_salinity = features.get('water_salinity_ppt', 25.0)
+        water_ph = features[FEATURE_IDX['water_ph']]
+        water_salinity = features[FEATURE_IDX['water_salinity_ppt']]
         if 6.0 <= water_ph <= 8.5:
             score += 3
         if 0 <= water_salinity <= 50:
             score += 3
-        
+
         # Soil quality
-        soil_carbon = features.get('soil_organic_carbon_percent', 2.0)
-        if soil_carbon > 1.0:
+        if features[FEATURE_IDX['soil_organic_carbon_percent']] > 1.0:
             score += 4
-        
+
         # Ensure score is in valid range
         score = max(0.0, min(100.0, score))
         return round(score, 2)
-    
+
+    def _calculate_fallback_scores_batch(self, X):
+        """
+        Vectorized rule-based fallback scoring over an (N, 15) feature matrix
+
+        Applies the same rules as _calculate_fallback_score but with NumPy
+        boolean masks so a whole batch is scored without Python branching.
+        """
+        np = _np
+
+        ecosystem = X[:, FEATURE_IDX['ecosystem_type_encoded']]
+        area = X[:, FEATURE_IDX['area_hectares']]
+        lat = X[:, FEATURE_IDX['latitude']]
+        lng = X[:, FEATURE_IDX['longitude']]
+        name_length = X[:, FEATURE_IDX['project_name_length']]
+        desc_length = X[:, FEATURE_IDX['description_length']]
+        total_media = (X[:, FEATURE_IDX['photo_count']]
+                       + X[:, FEATURE_IDX['video_count']]
+                       + X[:, FEATURE_IDX['document_count']])
+        water_ph = X[:, FEATURE_IDX['water_ph']]
+        water_salinity = X[:, FEATURE_IDX['water_salinity_ppt']]
+        soil_carbon = X[:, FEATURE_IDX['soil_organic_carbon_percent']]
+
+        score = np.full(X.shape[0], 50.0)  # Base score
+
+        # Ecosystem type bonus
+        score += np.where(ecosystem == 0, 10,
+                 np.where(ecosystem == 1, 5, 0))
+
+        # Area reasonableness (1-100 hectares is good)
+        score += np.where((area >= 1) & (area <= 100), 15,
+                 np.where((area >= 0.1) & (area <= 1000), 10,
+                 np.where(area > 0, 5, 0)))
+
+        # Location validity
+        valid_location = ((lat >= -90) & (lat <= 90)
+                          & (lng >= -180) & (lng <= 180)
+                          & ((lat != 0) | (lng != 0)))
+        score += np.where(valid_location, 10, 0)
+
+        # Data completeness
+        score += np.where(name_length > 5, 5, 0)
+        score += np.where(desc_length > 20, 5, 0)
+
+        # Media evidence
+        score += np.where(total_media >= 5, 10,
+                 np.where(total_media >= 1, 5, 0))
+
+        # Water quality reasonableness
+        score += np.where((water_ph >= 6.0) & (water_ph <= 8.5), 3, 0)
+        score += np.where((water_salinity >= 0) & (water_salinity <= 50), 3, 0)
+
+        # Soil quality
+        score += np.where(soil_carbon > 1.0, 4, 0)
+
+        # Ensure scores are in valid range
+        return np.clip(score, 0.0, 100.0).round(2)
+
     def test_model(self) -> Dict:
         """
         Test the ML model with sample data
@@ -419,7 +719,7 @@ class MLVerificationEngine:
         }
         
         print("🧪 Testing ML model with sample data...")
-        result = self.predict_quality_score(test_data)
+        result = self.predict_quality_score(test_data, debug=True)
         
         print(f"✅ Test completed!")
         print(f"Model Available: {self.model_available}")
@@ -434,20 +734,44 @@ class MLVerificationEngine:
         
         return result
 
-# Global instance
-ml_engine = MLVerificationEngine()
+# Shared engine, constructed on first use so importing this module
+# doesn't pay the pickle load unless a prediction is actually requested
+_ENGINE: Optional[MLVerificationEngine] = None
+
+def get_ml_engine() -> MLVerificationEngine:
+    """Return the shared ML engine, constructing it on first access"""
+    global _ENGINE
+    if _ENGINE is None:
+        _ENGINE = MLVerificationEngine()
+    return _ENGINE
+
+def __getattr__(name: str):
+    """Lazily construct the global ml_engine instance on first access (PEP 562)
+
+    Keeps 'from ml_verification import ml_engine' working while letting
+    'import ml_verification' return without paying the pickle load.
+    """
+    if name == 'ml_engine':
+        return get_ml_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def verify_project_ml(project_data: Dict) -> Dict:
     """
     Main function to verify project using ML model
     """
-    return ml_engine.predict_quality_score(project_data)
+    return get_ml_engine().predict_quality_score(project_data)
+
+def verify_projects_ml_batch(projects: List[Dict]) -> List[Dict]:
+    """
+    Batch version of verify_project_ml using a single model call
+    """
+    return get_ml_engine().predict_quality_scores_batch(projects)
 
 def test_ml_model() -> Dict:
     """
     Test function for ML model
     """
-    return ml_engine.test_model()
+    return get_ml_engine().test_model()
 
 if __name__ == "__main__":
     # Test the ML verification system
@@ -493,6 +493,14 @@ class NeonDBService:
         result = self.execute_query(query, (email,))
         return result[0] if result else None
     
+    def get_users_by_emails(self, emails: List[str]) -> Dict[str, Dict]:
+        """Get multiple users by email in a single query, keyed by email"""
+        if not emails:
+            return {}
+        query = 'SELECT * FROM users WHERE email = ANY(%s)'
+        result = self.execute_query(query, (list(emails),))
+        return {user['email']: user for user in result} if result else {}
+
     def get_user_by_id(self, user_id: str) -> Optional[Dict]:
         """Get user by user_id"""
         query = 'SELECT * FROM users WHERE user_id = %s'
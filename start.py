@@ -4,11 +4,24 @@ Startup script for Blue Carbon MRV System on Render
 """
 import os
 import sys
+import threading
+
+def _warm_ml_model():
+    """Load the BlueCarbon.pkl model into the cache in the background"""
+    try:
+        from ml_verification import get_ml_engine
+        get_ml_engine()
+    except Exception as e:
+        print(f"⚠️ ML model warm-up skipped: {e}")
 
 if __name__ == "__main__":
     # Add current directory to Python path
     sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-    
+
+    # Warm the ML model cache off the main thread so the server binds its
+    # port (and passes Render health checks) without waiting on the pickle load
+    threading.Thread(target=_warm_ml_model, name="ml-model-warmup", daemon=True).start()
+
     # Import and run the main production server
     from production_serverMAIN import main
     main()
\ No newline at end of file